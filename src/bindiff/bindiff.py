@@ -78,6 +78,8 @@ class BinDiff(BindiffFile):
                  additional attributes and method to the class.
     """
 
+    __slots__ = ("primary", "secondary")
+
     def __init__(
         self,
         primary: Union[ProgramBinExport, str],
@@ -307,29 +309,26 @@ class BinDiff(BindiffFile):
         ]
 
         logging.debug(f"run diffing: {' '.join(cmd_line)}")
-        process = subprocess.Popen(cmd_line, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        out, err = process.communicate()
-        retcode = process.returncode
+        retcode = subprocess.run(
+            cmd_line, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        ).returncode
         if retcode != 0:
             logging.error(f"differ terminated with error code: {retcode}")
             return False
         # Now look for the generated file
         out_file = tmp_dir / "{}_vs_{}.BinDiff".format(f1.stem, f2.stem)
-        if out_file.exists():
-            shutil.move(out_file, out_diff)
-        else:  # try iterating the directory to find the .BinExport file
-            candidates = list(tmp_dir.iterdir())
-            if len(candidates) > 1:
+        if not out_file.exists():  # otherwise take the first .BinExport file of the directory
+            count, out_file = 0, None
+            for file in tmp_dir.iterdir():
+                count += 1
+                if out_file is None and file.suffix == ".BinExport":
+                    out_file = file
+            if count > 1:
                 logging.warning("the output directory not meant to contain multiple files")
-            found = False
-            for file in candidates:
-                if file.suffix == ".BinExport":
-                    shutil.move(file, out_diff)
-                    found = True
-                    break
-            if not found:
+            if out_file is None:
                 logging.error("diff file .BinExport not found")
                 return False
+        shutil.move(out_file, out_diff)
         shutil.rmtree(tmp_dir, ignore_errors=True)
         return True
 
@@ -4,10 +4,19 @@ import hashlib
 from datetime import datetime
 from dataclasses import dataclass
 from typing import Union
-import ctypes
+from itertools import groupby
+from operator import itemgetter
 
 from bindiff.types import FunctionAlgorithm, BasicBlockAlgorithm
 
+# Enum members indexed by value, avoid going through the enum constructor for every row
+# (it is only called for unknown values, to raise its ValueError)
+_FALGO = {v.value: v for v in FunctionAlgorithm}
+_BBALGO = {v.value: v for v in BasicBlockAlgorithm}
+
+# SQLite stores addresses as signed 64-bit integers, masking gives back the unsigned value
+_U64_MASK = 0xFFFFFFFFFFFFFFFF
+
 
 @dataclass
 class File:
@@ -75,6 +84,26 @@ class BindiffFile(object):
     in the database.
     """
 
+    __slots__ = (
+        "_file",
+        "db",
+        "similarity",
+        "confidence",
+        "version",
+        "created",
+        "modified",
+        "primary_file",
+        "secondary_file",
+        "primary_functions_match",
+        "secondary_functions_match",
+        "_function_match_ids",
+        "primary_basicblock_match",
+        "secondary_basicblock_match",
+        "primary_instruction_match",
+        "secondary_instruction_match",
+        "__weakref__",
+    )
+
     def __init__(self, file: Union[Path, str], permission: str = "ro"):
         """
         :param file: path to Bindiff database
@@ -84,6 +113,11 @@ class BindiffFile(object):
 
         # Open database
         self.db = sqlite3.connect(f"file:{str(file)}?mode={permission}", uri=True)
+        # Let SQLite map the database in memory instead of reading it page by page
+        self.db.execute("PRAGMA mmap_size=268435456")
+        cursor = self.db.cursor()
+        # Run all the loaders in a single read transaction
+        cursor.execute("BEGIN")
 
         # fmt: off
         # Global variables
@@ -92,12 +126,12 @@ class BindiffFile(object):
         self.version: str = None       #: version of the differ used for diffing
         self.created: datetime = None  #: Database creation date
         self.modified: datetime = None #: Database last modification date
-        self._load_metadata(self.db.cursor())
+        self._load_metadata(cursor)
 
         # Files
         self.primary_file: File = None    #: Primary file
         self.secondary_file: File = None  #: Secondary file
-        self._load_file(self.db.cursor())
+        self._load_file(cursor)
         # fmt: on
 
         # Function matches
@@ -107,7 +141,8 @@ class BindiffFile(object):
         self.secondary_functions_match: dict[
             int, FunctionMatch
         ] = {}  #: FunctionMatch indexed by addresses in secondary
-        self._load_function_match(self.db.cursor())
+        self._function_match_ids: dict[int, FunctionMatch] = {}  # FunctionMatch indexed by DB id
+        self._load_function_match(cursor)
 
         # Basicblock matches:  BB-addr -> fun-addr -> match
         self.primary_basicblock_match: dict[
@@ -116,13 +151,14 @@ class BindiffFile(object):
         self.secondary_basicblock_match: dict[
             int, dict[int, BasicBlockMatch]
         ] = {}  #: Basic block match from secondary
-        self._load_basicblock_match(self.db.cursor())
+        self._load_basicblock_match(cursor)
 
         # Instruction matches
         # {inst_addr : {match_func_addr : match_inst_addr}}
         self.primary_instruction_match: dict[int, dict[int, int]] = {}
         self.secondary_instruction_match: dict[int, dict[int, int]] = {}
-        self._load_instruction_match(self.db.cursor())
+        self._load_instruction_match(cursor)
+        self.db.commit()
 
     @property
     def unmatched_primary_count(self) -> int:
@@ -184,10 +220,10 @@ class BindiffFile(object):
         self.created, self.modified, self.similarity, self.confidence = cursor.execute(
             query
         ).fetchone()
-        self.created = datetime.strptime(self.created, "%Y-%m-%d %H:%M:%S")
-        self.modified = datetime.strptime(self.modified, "%Y-%m-%d %H:%M:%S")
-        self.similarity = float("{0:.3f}".format(self.similarity))  # round the value to 3 decimals
-        self.confidence = float("{0:.3f}".format(self.confidence))  # round the value to 3 decimals
+        self.created = datetime.fromisoformat(self.created)
+        self.modified = datetime.fromisoformat(self.modified)
+        self.similarity = round(self.similarity, 3)  # round the value to 3 decimals
+        self.confidence = round(self.confidence, 3)  # round the value to 3 decimals
 
     def _load_function_match(self, cursor: sqlite3.Cursor) -> None:
         """
@@ -195,13 +231,19 @@ class BindiffFile(object):
 
         :param cursor: sqlite3 cursor to the DB
         """
-        i2u = lambda x: ctypes.c_ulonglong(x).value
+        # Bind everything used per row to locals (fast lookups inside the loop)
+        mask, algos = _U64_MASK, _FALGO
+        primary_match = self.primary_functions_match
+        secondary_match = self.secondary_functions_match
+        ids = self._function_match_ids
         fun_query = "SELECT id, address1, name1, address2, name2, similarity, confidence, algorithm FROM function"
         for id, addr1, name1, addr2, name2, sim, conf, alg in cursor.execute(fun_query):
-            addr1, addr2 = i2u(addr1), i2u(addr2)
-            m = FunctionMatch(id, addr1, name1, addr2, name2, sim, conf, FunctionAlgorithm(alg))
-            self.primary_functions_match[addr1] = m
-            self.secondary_functions_match[addr2] = m
+            addr1, addr2 = addr1 & mask, addr2 & mask
+            algo = algos.get(alg) or FunctionAlgorithm(alg)
+            m = FunctionMatch(id, addr1, name1, addr2, name2, sim, conf, algo)
+            primary_match[addr1] = m
+            secondary_match[addr2] = m
+            ids[id] = m
 
     def _load_basicblock_match(self, cursor: sqlite3.Cursor) -> None:
         """
@@ -209,25 +251,27 @@ class BindiffFile(object):
 
         :param cursor: sqlite3 cursor to the DB
         """
-        mapping = {x.id: x for x in self.function_matches}
+        algos = _BBALGO
+        mapping = self._function_match_ids
+        primary_match = self.primary_basicblock_match
+        secondary_match = self.secondary_basicblock_match
         query = "SELECT id, functionid, address1, address2, algorithm FROM basicblock"
         for id, fun_id, bb_addr1, bb_addr2, bb_algo in cursor.execute(query):
             fun_match = mapping[fun_id]
-            assert fun_id == mapping[fun_id].id
-            bmatch = BasicBlockMatch(
-                id, fun_match, bb_addr1, bb_addr2, BasicBlockAlgorithm(bb_algo)
-            )
+            assert fun_id == fun_match.id
+            algo = algos.get(bb_algo) or BasicBlockAlgorithm(bb_algo)
+            bmatch = BasicBlockMatch(id, fun_match, bb_addr1, bb_addr2, algo)
 
             # As a basic block address can be in multiple functions create a nested dictionnary
-            if bb_addr1 in self.primary_basicblock_match:
-                self.primary_basicblock_match[bb_addr1][fun_match.address1] = bmatch
+            if maps := primary_match.get(bb_addr1):
+                maps[fun_match.address1] = bmatch
             else:
-                self.primary_basicblock_match[bb_addr1] = {fun_match.address1: bmatch}
+                primary_match[bb_addr1] = {fun_match.address1: bmatch}
 
-            if bb_addr2 in self.secondary_basicblock_match:
-                self.secondary_basicblock_match[bb_addr2][fun_match.address2] = bmatch
+            if maps := secondary_match.get(bb_addr2):
+                maps[fun_match.address2] = bmatch
             else:
-                self.secondary_basicblock_match[bb_addr2] = {fun_match.address2: bmatch}
+                secondary_match[bb_addr2] = {fun_match.address2: bmatch}
 
     def _load_instruction_match(self, cursor: sqlite3.Cursor) -> None:
         """
@@ -235,23 +279,34 @@ class BindiffFile(object):
 
         :param cursor: sqlite3 cursor to the DB
         """
-        i2u = lambda x: ctypes.c_ulonglong(x).value
-        mapping = {x.id: x for x in self.basicblock_matches}
-        query = "SELECT basicblockid, address1, address2 FROM instruction"
-        for id, i_addr1, i_addr2 in cursor.execute(query):
-            i_addr1, i_addr2 = i2u(i_addr1), i2u(i_addr2)
-            fun_match = mapping[id].function_match
-
-            # Set mapping for instructions
-            if i_addr1 in self.primary_instruction_match:
-                self.primary_instruction_match[i_addr1][fun_match.address1] = i_addr2
-            else:
-                self.primary_instruction_match[i_addr1] = {fun_match.address1: i_addr2}
-
-            if i_addr2 in self.secondary_instruction_match:
-                self.secondary_instruction_match[i_addr2][fun_match.address2] = i_addr1
-            else:
-                self.secondary_instruction_match[i_addr2] = {fun_match.address2: i_addr1}
+        mask = _U64_MASK
+        mapping = self._function_match_ids
+        primary_match = self.primary_instruction_match
+        secondary_match = self.secondary_instruction_match
+        # Scan instructions once and fetch their basic block by rowid (the plan SQLite picks
+        # already, CROSS JOIN only pins it). Instructions are stored block by block, so
+        # consecutive rows share the same function and its match is resolved once per run of
+        # rows, no sorting needed.
+        query = (
+            "SELECT bb.functionid, i.address1, i.address2 FROM instruction i"
+            " CROSS JOIN basicblock bb ON i.basicblockid = bb.id"
+        )
+        for fun_id, rows in groupby(cursor.execute(query), key=itemgetter(0)):
+            fun_match = mapping[fun_id]
+            fun_addr1, fun_addr2 = fun_match.address1, fun_match.address2
+            for _, i_addr1, i_addr2 in rows:
+                i_addr1, i_addr2 = i_addr1 & mask, i_addr2 & mask
+
+                # Set mapping for instructions
+                if maps := primary_match.get(i_addr1):
+                    maps[fun_addr1] = i_addr2
+                else:
+                    primary_match[i_addr1] = {fun_addr1: i_addr2}
+
+                if maps := secondary_match.get(i_addr2):
+                    maps[fun_addr2] = i_addr1
+                else:
+                    secondary_match[i_addr2] = {fun_addr2: i_addr1}
 
     @staticmethod
     def init_database(db: sqlite3.Connection) -> None: